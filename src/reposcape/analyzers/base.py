@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 
 if TYPE_CHECKING:
@@ -17,13 +17,24 @@ if TYPE_CHECKING:
 class CodeAnalyzer(ABC):
     """Abstract base class for code analysis."""
 
+    # File suffixes accepted by the default can_handle
+    extensions: ClassVar[tuple[str, ...]] = ()
+    # Match extensions regardless of case, extensions must then be lowercase
+    ignore_case: ClassVar[bool] = False
+
     def _is_private(self, name: str) -> bool:
         """Check if a name represents a private element."""
         return name.startswith("_") and not name.endswith("_")
 
-    @abstractmethod
     def can_handle(self, path: str | PathLike[str] | upath.UPath) -> bool:
-        """Check if this analyzer can handle the given file."""
+        """Check if this analyzer can handle the given file.
+
+        By default, checks whether the path ends with one of `extensions`.
+        """
+        name = str(path)
+        if self.ignore_case:
+            name = name.lower()
+        return name.endswith(self.extensions)
 
     @abstractmethod
     def analyze_file(
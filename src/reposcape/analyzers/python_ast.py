@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import ast
 import inspect
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from upath import UPath
 
@@ -13,15 +13,33 @@ from reposcape.models.nodes import CodeNode, NodeType, Reference
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from os import PathLike
     from types import ModuleType
 
     import upath
 
 
+def _visitor_methods(cls: type[ast.NodeVisitor]) -> dict[type[ast.AST], str]:
+    """Map AST node types to the names of the visit_* methods defined on cls."""
+    methods: dict[type[ast.AST], str] = {}
+    for name in dir(cls):
+        # Skip NodeVisitor's own visit_Constant, which only serves legacy visitors
+        if name.startswith("visit_") and getattr(cls, name) is not getattr(
+            ast.NodeVisitor, name, None
+        ):
+            node_type = getattr(ast, name.removeprefix("visit_"), None)
+            if isinstance(node_type, type) and issubclass(node_type, ast.AST):
+                methods[node_type] = name
+    return methods
+
+
 class SymbolCollector(ast.NodeVisitor):
     """Collect symbols and their references from Python AST."""
 
+    # Visitor method names per collector class, built on first instantiation
+    _visitor_tables: ClassVar[dict[type, dict[type[ast.AST], str]]] = {}
+
     def __init__(
         self,
         path: str,
@@ -33,6 +51,48 @@ class SymbolCollector(ast.NodeVisitor):
         self.references = references
         self.import_map: dict[str, str] = {}
         self.current_node: CodeNode | None = None
+        # Statements directly in a class body, used to tell methods from functions
+        self._class_body_ids: set[int] = set()
+        cls = type(self)
+        if (methods := self._visitor_tables.get(cls)) is None:
+            methods = self._visitor_tables[cls] = _visitor_methods(cls)
+        self._dispatch: dict[type[ast.AST], Callable[[Any], Any]] = {
+            node_type: getattr(self, name) for node_type, name in methods.items()
+        }
+
+    def visit(self, node: ast.AST) -> Any:
+        """Visit a node using the dispatch table instead of a per-node getattr."""
+        visitor = self._dispatch.get(type(node))
+        if visitor is None:
+            return self.generic_visit(node)
+        return visitor(node)
+
+    def generic_visit(self, node: ast.AST) -> None:
+        """Visit all descendants of a node in source order.
+
+        Nodes without a dedicated visitor are expanded on an explicit stack
+        instead of through a visit/generic_visit call pair per node, which
+        keeps the many plain expression nodes cheap to walk.
+        """
+        dispatch = self._dispatch
+        ast_node = ast.AST
+        stack: list[ast.AST] = [node]
+        visit_children = True  # the start node itself was already dispatched
+        while stack:
+            child = stack.pop()
+            if not visit_children:
+                visitor = dispatch.get(type(child))
+                if visitor is not None:
+                    visitor(child)
+                    continue
+            visit_children = False
+            # Push fields in reverse so they are popped in source order
+            for field in reversed(child._fields):
+                value = getattr(child, field, None)
+                if isinstance(value, list):
+                    stack += [item for item in reversed(value) if isinstance(item, ast_node)]
+                elif isinstance(value, ast_node):
+                    stack.append(value)
 
     def _is_private(self, name: str) -> bool:
         """Check if a name represents a private element."""
@@ -40,13 +100,14 @@ class SymbolCollector(ast.NodeVisitor):
 
     def visit_ClassDef(self, node: ast.ClassDef) -> Any:
         """Process class definitions."""
+        add_references = self._add_references_from_expr
         # Add references from bases
         for base in node.bases:
-            self._add_references_from_expr(base)
+            add_references(base)
 
         # Add references from decorators
         for decorator in node.decorator_list:
-            self._add_references_from_expr(decorator)
+            add_references(decorator)
 
         # Create class node
         class_node = CodeNode(
@@ -60,6 +121,7 @@ class SymbolCollector(ast.NodeVisitor):
         )
 
         # Store class node before visiting children
+        self._class_body_ids.update(map(id, node.body))
         old_current = self.current_node
         self.current_node = class_node
 
@@ -74,21 +136,22 @@ class SymbolCollector(ast.NodeVisitor):
 
     def visit_FunctionDef(self, node: ast.FunctionDef) -> Any:
         """Process function definitions."""
+        add_references = self._add_references_from_expr
         # Add references from decorators
         for decorator in node.decorator_list:
-            self._add_references_from_expr(decorator)
+            add_references(decorator)
 
         # Add references from return annotation
         if node.returns:
-            self._add_references_from_expr(node.returns)
+            add_references(node.returns)
 
         # Add references from argument annotations
         for arg in node.args.args:
             if arg.annotation:
-                self._add_references_from_expr(arg.annotation)
+                add_references(arg.annotation)
 
         # Create function node
-        is_method = isinstance(node.parent, ast.ClassDef)  # type: ignore[attr-defined]
+        is_method = id(node) in self._class_body_ids
         func_node = CodeNode(
             name=node.name,
             node_type=NodeType.METHOD if is_method else NodeType.FUNCTION,
@@ -102,11 +165,7 @@ class SymbolCollector(ast.NodeVisitor):
         # For methods, add to class's children
         if is_method and isinstance(self.current_node, CodeNode):
             assert self.current_node.children is not None
-            object.__setattr__(
-                self.current_node,
-                "children",
-                {**self.current_node.children, node.name: func_node},
-            )
+            self.current_node.children[node.name] = func_node  # type: ignore
         else:
             # Top-level functions go in main symbols
             self.symbols[node.name] = func_node
@@ -119,7 +178,7 @@ class SymbolCollector(ast.NodeVisitor):
 
     def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef) -> Any:
         """Process async function definitions."""
-        is_method = isinstance(node.parent, ast.ClassDef)  # type: ignore[attr-defined]
+        is_method = id(node) in self._class_body_ids
 
         # Create function node
         func_node = CodeNode(
@@ -136,11 +195,7 @@ class SymbolCollector(ast.NodeVisitor):
         # For methods, add to class's children
         if is_method and isinstance(self.current_node, CodeNode):
             assert self.current_node.children is not None
-            object.__setattr__(
-                self.current_node,
-                "children",
-                {**self.current_node.children, node.name: func_node},
-            )
+            self.current_node.children[node.name] = func_node  # type: ignore
         else:
             # Top-level functions go in main symbols
             self.symbols[node.name] = func_node
@@ -166,61 +221,79 @@ class SymbolCollector(ast.NodeVisitor):
     def visit_Name(self, node: ast.Name) -> Any:
         """Process name references."""
         if isinstance(node.ctx, ast.Load):
+            import_map = self.import_map
             # Check if this is a reference to an imported name
-            ref_name = self.import_map.get(node.id, node.id)
+            ref_name = import_map.get(node.id, node.id)
             self.references.append(
                 Reference(
                     name=ref_name,
                     path=self.path,
                     line=node.lineno,
                     column=node.col_offset,
-                    module_reference=ref_name in self.import_map,
+                    module_reference=ref_name in import_map,
                     source=self.current_node,
                 )
             )
 
     def _add_references_from_expr(self, node: ast.expr) -> None:
         """Extract references from an expression node."""
-        for child in ast.walk(node):
+        refs_append = self.references.append
+        path = self.path
+        ast_node = ast.AST
+        # Breadth-first like ast.walk, but iterating a growing list instead of
+        # going through a generator and a deque for these small subtrees
+        todo: list[ast.AST] = [node]
+        for child in todo:
             if isinstance(child, ast.Name):
-                self.references.append(
+                refs_append(
                     Reference(
                         name=child.id,
-                        path=self.path,
+                        path=path,
                         line=child.lineno,
                         column=child.col_offset,
                     )
                 )
-            elif isinstance(child, ast.Attribute):
-                self.references.append(
+                continue  # only holds the expression context
+            if isinstance(child, ast.Attribute):
+                refs_append(
                     Reference(
                         name=child.attr,
-                        path=self.path,
+                        path=path,
                         line=child.lineno,
                         column=child.col_offset,
                     )
                 )
+            for field in child._fields:
+                value = getattr(child, field, None)
+                if isinstance(value, list):
+                    todo += [item for item in value if isinstance(item, ast_node)]
+                elif isinstance(value, ast_node):
+                    todo.append(value)
 
     def visit_Call(self, node: ast.Call) -> Any:
         """Process function/class calls."""
-        self._add_references_from_expr(node.func)
+        add_references = self._add_references_from_expr
+        add_references(node.func)
         for arg in node.args:
-            self._add_references_from_expr(arg)
+            add_references(arg)
         for kw in node.keywords:
-            self._add_references_from_expr(kw.value)
+            add_references(kw.value)
         self.generic_visit(node)
 
     def visit_Import(self, node: ast.Import) -> Any:
         """Process imports to track references."""
+        refs_append = self.references.append
+        import_map = self.import_map
+        path, line, column = self.path, node.lineno, node.col_offset
         for alias in node.names:
             asname = alias.asname or alias.name
-            self.import_map[asname] = alias.name
-            self.references.append(
+            import_map[asname] = alias.name
+            refs_append(
                 Reference(
                     name=alias.name,
-                    path=self.path,
-                    line=node.lineno,
-                    column=node.col_offset,
+                    path=path,
+                    line=line,
+                    column=column,
                     module_reference=True,  # New field
                 )
             )
@@ -228,16 +301,19 @@ class SymbolCollector(ast.NodeVisitor):
     def visit_ImportFrom(self, node: ast.ImportFrom) -> Any:
         """Process from-imports to track references."""
         module = node.module or ""
+        refs_append = self.references.append
+        import_map = self.import_map
+        path, line, column = self.path, node.lineno, node.col_offset
         for alias in node.names:
             asname = alias.asname or alias.name
             full_name = f"{module}.{alias.name}" if module else alias.name
-            self.import_map[asname] = full_name
-            self.references.append(
+            import_map[asname] = full_name
+            refs_append(
                 Reference(
                     name=full_name,
-                    path=self.path,
-                    line=node.lineno,
-                    column=node.col_offset,
+                    path=path,
+                    line=line,
+                    column=column,
                     module_reference=True,
                 )
             )
@@ -278,9 +354,7 @@ class SymbolCollector(ast.NodeVisitor):
 class PythonAstAnalyzer(CodeAnalyzer):
     """Analyze Python code using the built-in ast module."""
 
-    def can_handle(self, path: str | PathLike[str] | upath.UPath) -> bool:
-        """Check if file is a Python file."""
-        return str(path).endswith(".py")
+    extensions = (".py",)
 
     def analyze_file(
         self,
@@ -290,15 +364,9 @@ class PythonAstAnalyzer(CodeAnalyzer):
         """Analyze a Python file."""
         path_obj = UPath(path)
         if content is None:
-            content = path_obj.read_text(encoding="utf-8")
-        # Parse the AST
+            # utf-8-sig keeps a byte order mark out of the stored content
+            content = path_obj.read_text(encoding="utf-8-sig")
         tree = ast.parse(content)
-        ast.fix_missing_locations(tree)
-        # Add parent links to AST nodes
-        for parent in ast.walk(tree):
-            for child in ast.iter_child_nodes(parent):
-                child.parent = parent  # type: ignore[attr-defined]
-
         # Collect symbols
         collector = SymbolCollector(
             path=str(path),
@@ -335,12 +403,6 @@ class PythonAstAnalyzer(CodeAnalyzer):
 
         # Parse the AST
         tree = ast.parse(source)
-        ast.fix_missing_locations(tree)
-
-        # Add parent links
-        for parent in ast.walk(tree):
-            for child in ast.iter_child_nodes(parent):
-                child.parent = parent  # type: ignore[attr-defined]
 
         # Collect symbols
         collector = SymbolCollector(
@@ -56,10 +56,7 @@ class SymbolCollector:
         for child in node.get_children():
             self.visit(child)
 
-        class_node = CodeNode(**{
-            **dataclasses.asdict(class_node),
-            "children": self.symbols,
-        })
+        class_node = dataclasses.replace(class_node, children=self.symbols)
 
         self.symbols = old_symbols
         self.symbols[node.name] = class_node
@@ -117,14 +114,12 @@ class SymbolCollector:
 class PythonAstroidAnalyzer(CodeAnalyzer):
     """Analyze Python code using astroid."""
 
+    extensions = (".py",)
+
     def __init__(self) -> None:
         """Initialize with astroid manager for caching."""
         self.manager = astroid.MANAGER
 
-    def can_handle(self, path: str | PathLike[str] | upath.UPath) -> bool:
-        """Check if file is a Python file."""
-        return str(path).endswith(".py")
-
     def analyze_file(
         self,
         path: str | PathLike[str] | upath.UPath,
@@ -58,10 +58,7 @@ class SymbolCollector(cst.CSTVisitor):
         self.generic_visit(node)
 
         # Update class with its methods
-        class_node = CodeNode(**{
-            **dataclasses.asdict(class_node),
-            "children": self.symbols,
-        })
+        class_node = dataclasses.replace(class_node, children=self.symbols)
 
         # Restore old symbols and add class
         self.symbols = old_symbols
@@ -130,9 +127,7 @@ class SymbolCollector(cst.CSTVisitor):
 class PythonCSTAnalyzer(CodeAnalyzer):
     """Analyze Python code using LibCST."""
 
-    def can_handle(self, path: str | PathLike[str] | upath.UPath) -> bool:
-        """Check if file is a Python file."""
-        return str(path).endswith(".py")
+    extensions = (".py",)
 
     def analyze_file(
         self,
@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 from reposcape.importance.base import ImportanceCalculator
-from reposcape.importance.graph import Graph
+from reposcape.importance.graph import EdgeView, Graph
 from reposcape.importance.scoring import GraphScorer, PageRankScorer, ReferenceScorer
 
 __all__ = [
+    "EdgeView",
     "Graph",
     "GraphScorer",
     "ImportanceCalculator",
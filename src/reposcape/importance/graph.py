@@ -1,12 +1,43 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
 
 import networkx as nx
 
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterator, KeysView
+
+
+class EdgeView(Mapping[str, float]):
+    """Read-only view of a node's outgoing edges, mapping targets to weights.
+
+    Reads the graph's adjacency directly instead of copying it, so it reflects
+    later changes to the node's edges.
+    """
+
+    __slots__ = ("_adjacency",)
+
+    def __init__(self, adjacency: Mapping[str, Mapping[str, Any]]) -> None:
+        """Initialize view.
+
+        Args:
+            adjacency: Edge attributes by target node
+        """
+        self._adjacency = adjacency
+
+    def __getitem__(self, target: str) -> float:
+        return self._adjacency[target].get("weight", 1.0)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._adjacency)
+
+    def __len__(self) -> int:
+        return len(self._adjacency)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
 
 
 class Graph:
@@ -40,16 +71,27 @@ class Graph:
         self.add_node(to_id)
         self.graph.add_edge(from_id, to_id, weight=weight)
 
-    def get_nodes(self) -> set[str]:
-        """Get all node IDs."""
-        return set(self.graph.nodes())
+    def has_node(self, node_id: str) -> bool:
+        """Check whether a node is part of the graph."""
+        return node_id in self.graph
+
+    def get_nodes(self) -> KeysView[str]:
+        """Get all node IDs.
 
-    def get_edges(self, node_id: str) -> dict[str, float]:
-        """Get outgoing edges and their weights for a node."""
+        Returns a live set-like view instead of a copy. Take a `set()` of it
+        before removing nodes while iterating.
+        """
+        return self.graph.nodes.keys()
+
+    def get_edges(self, node_id: str) -> EdgeView:
+        """Get outgoing edges and their weights for a node.
+
+        Returns a live view, which is empty for unknown nodes.
+        """
         if node_id not in self.graph:
-            return {}
+            return EdgeView({})
 
-        return {target: data.get("weight", 1.0) for target, data in self.graph[node_id].items()}
+        return EdgeView(self.graph[node_id])
 
     def in_edges(self, node_id: str) -> Iterator[tuple[str, str, float]]:
         """Get incoming edges for a node as (source, target, weight) tuples."""
@@ -75,29 +75,27 @@ class ReferenceScorer(GraphScorer):
         weights: dict[str, float] | None = None,
     ) -> dict[str, float]:
         """Calculate reference-based scores."""
-        important_nodes = {n for n in (important_nodes or set()) if n in graph.get_nodes()}
-        weights = {k: v for k, v in (weights or {}).items() if k in graph.get_nodes()}
-
-        # Initialize scores
-        scores: dict[str, float] = dict.fromkeys(graph.get_nodes(), 0.0)
-
-        # Add base scores from references
-        for node_id in graph.get_nodes():
-            # Incoming references score
-            in_edges = list(graph.in_edges(node_id))
-            scores[node_id] += len(in_edges) * self.ref_weight
-
-            # Outgoing references score
-            out_edges = list(graph.out_edges(node_id))
-            scores[node_id] += len(out_edges) * self.outref_weight
-
+        # Base scores from incoming and outgoing reference counts
+        nx_graph = graph.get_graph()
+        in_degrees = dict(nx_graph.in_degree)
+        ref_weight = self.ref_weight
+        outref_weight = self.outref_weight
+        scores: dict[str, float] = {
+            node_id: in_degrees[node_id] * ref_weight + out_degree * outref_weight
+            for node_id, out_degree in nx_graph.out_degree
+        }
+
+        # Scores hold exactly the graph nodes, so unknown ids can be skipped in place
         # Apply focus boost to important nodes
-        for node_id in important_nodes:
-            scores[node_id] *= self.focus_boost
+        focus_boost = self.focus_boost
+        for node_id in important_nodes or ():
+            if node_id in scores:
+                scores[node_id] *= focus_boost
 
         # Apply additional weights
-        for node_id, weight in weights.items():
-            scores[node_id] *= weight
+        for node_id, weight in (weights or {}).items():
+            if node_id in scores:
+                scores[node_id] *= weight
 
         return self._normalize_scores(scores)
 
@@ -109,19 +107,23 @@ class ReferenceScorer(GraphScorer):
         """Calculate scores based on distance from important nodes."""
         nx_graph = graph.get_graph()
         scores: dict[str, float] = dict.fromkeys(graph.get_nodes(), 0.0)
+        # Decay per distance, shared by all sources and extended as deeper layers show up
+        decay = self.distance_decay
+        decay_table = [1.0]
 
         # For each important node
         for start_id in important_nodes:
-            # Calculate shortest paths to all other nodes
-            try:
-                paths = nx.single_source_shortest_path_length(nx_graph, start_id)
-            except nx.NetworkXError:
+            if not graph.has_node(start_id):
                 continue
 
-            # Convert path lengths to scores
-            for node_id, distance in paths.items():
+            # Walk BFS layers so the decay is looked up once per distance, not per node
+            for distance, layer in enumerate(nx.bfs_layers(nx_graph, start_id)):
+                if distance == len(decay_table):
+                    decay_table.append(decay**distance)
                 # Score decreases with distance
-                scores[node_id] += self.distance_decay**distance
+                boost = decay_table[distance]
+                for node_id in layer:
+                    scores[node_id] += boost
 
         return scores
 
@@ -146,10 +148,9 @@ class PageRankScorer(GraphScorer):
         if important_nodes and weights:
             personalization = {node: weights.get(node, 1.0) for node in important_nodes}
 
+        # nx.pagerank already returns a fresh node -> score dict, no need to copy it
         try:
-            scores = nx.pagerank(g, personalization=personalization, dangling=personalization)
+            return nx.pagerank(g, personalization=personalization, dangling=personalization)
         except nx.PowerIterationFailedConvergence:
             # Fall back to unweighted pagerank
-            scores = nx.pagerank(g)
-
-        return dict(scores)
+            return nx.pagerank(g)
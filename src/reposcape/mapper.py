@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ProcessPoolExecutor
+import glob
 import importlib
+import os
+from pathlib import PurePosixPath
 import pkgutil
+import re
 from types import ModuleType
 from typing import TYPE_CHECKING, overload
 import warnings
 
 from upath import UPath
 
-from reposcape.analyzers import PythonAstAnalyzer, TextAnalyzer
+from reposcape.analyzers import CodeAnalyzer, PythonAstAnalyzer, TextAnalyzer
 from reposcape.importance import ImportanceCalculator, ReferenceScorer
 from reposcape.models import CodeNode, DetailLevel, NodeType
 from reposcape.serializers import CompactSerializer, MarkdownSerializer, TreeSerializer
@@ -20,12 +25,50 @@ if TYPE_CHECKING:
     from collections.abc import Sequence
     from os import PathLike
 
-    from reposcape.analyzers import CodeAnalyzer
     from reposcape.importance import GraphScorer
     from reposcape.models.options import FormatType, PrivacyMode
     from reposcape.serializers import CodeSerializer
 
 
+def _compile_exclude_patterns(patterns: Sequence[str]) -> re.Pattern[str] | None:
+    """Compile glob patterns into one regex with `PurePath.match` semantics.
+
+    Relative patterns match from the right, absolute patterns match the whole
+    path and "**" acts like "*". Match the result against `path.as_posix()`.
+    """
+    if not patterns:
+        return None
+    parts = []
+    for pattern in patterns:
+        pure = PurePosixPath(pattern)
+        regex = glob.translate(pure.as_posix(), recursive=False, include_hidden=True, seps="/")
+        # Relative patterns may start at any path component, but not at the anchor
+        parts.append(f"^{regex}" if pure.is_absolute() else f"(?:^|/)(?=[^/]){regex}")
+    flags = 0 if os.path.normcase("A") == "A" else re.IGNORECASE
+    return re.compile("|".join(parts), flags)
+
+
+def _analyze_file(analyzer: CodeAnalyzer | None, path: UPath) -> list[CodeNode] | Exception:
+    """Analyze a single file, returning the error instead of raising it.
+
+    Module-level so it can be dispatched to worker processes.
+    """
+    try:
+        if analyzer:
+            return analyzer.analyze_file(path)
+        # Create basic file node for unanalyzed files
+        return [
+            CodeNode(
+                name=path.name,
+                node_type=NodeType.FILE,
+                path=str(path),
+                content=path.read_text(encoding="utf-8"),
+            )
+        ]
+    except Exception as e:  # noqa: BLE001
+        return e
+
+
 class RepoMapper:
     """Maps repository structure with focus on important elements."""
 
@@ -35,6 +78,7 @@ class RepoMapper:
         analyzers: Sequence[CodeAnalyzer] | None = None,
         scorer: GraphScorer | None = None,
         serializer: FormatType | CodeSerializer = "markdown",
+        max_workers: int | None = 1,
     ):
         """Initialize RepoMapper.
 
@@ -42,8 +86,15 @@ class RepoMapper:
             analyzers: Code analyzers to use, defaults to [PythonAstAnalyzer]
             scorer: Graph scorer for importance calculation
             serializer: Serializer for output generation
+            max_workers: Max worker processes for analyzing local repositories.
+                Defaults to 1, which analyzes files in the current process.
+                None uses the CPU count. Parallel analysis needs picklable
+                analyzers and, with the "spawn" start method (macOS, Windows),
+                a script guarded by `if __name__ == "__main__"`. If the pool
+                fails, files are analyzed in-process instead.
         """
         self.analyzers = list(analyzers) if analyzers else [PythonAstAnalyzer(), TextAnalyzer()]
+        self.max_workers = max_workers
         self.importance_calculator = ImportanceCalculator(scorer or ReferenceScorer())
 
         # Handle serializer string or instance
@@ -266,7 +317,7 @@ class RepoMapper:
         exclude_patterns: list[str] | None = None,
     ) -> CodeNode:
         """Analyze repository and build CodeNode tree."""
-        exclude_patterns = exclude_patterns or []
+        excluded = _compile_exclude_patterns(exclude_patterns or [])
 
         # Create root node
         root = CodeNode(
@@ -276,67 +327,129 @@ class RepoMapper:
             children={},
         )
 
-        # Build directory structure
+        # Collect files and their analyzers
+        by_suffix = self._analyzers_by_suffix()
+        files: list[tuple[UPath, UPath, CodeAnalyzer | None]] = []
         for path in repo_path.glob("**/*"):
             # Skip excluded paths
-            if any(path.match(pattern) for pattern in exclude_patterns):
+            if excluded and excluded.search(path.as_posix()):
                 continue
 
             # Skip directories, we'll create them as needed
             if path.is_dir():
                 continue
 
-            rel_path = path.relative_to(repo_path)
-
-            try:
-                # Find suitable analyzer
-                analyzer = None
-                for a in self.analyzers:
-                    if a.can_handle(path):
-                        analyzer = a
-                        break
-
-                if analyzer:
-                    # Analyze file with specific analyzer
-                    nodes = analyzer.analyze_file(path)
-                    # Ensure correct paths in nodes
-                    for node in nodes:
-                        object.__setattr__(node, "path", str(rel_path))
-                else:
-                    # Create basic file node for unanalyzed files
-                    nodes = [
-                        CodeNode(
-                            name=path.name,
-                            node_type=NodeType.FILE,
-                            path=str(rel_path),
-                            content=path.read_text(encoding="utf-8"),
-                        )
-                    ]
-
-                # Add to tree
-                self._add_to_tree(root, rel_path, nodes)
-
-            except Exception as e:  # noqa: BLE001
-                msg = f"Error analyzing {path}: {e}"
+            analyzer = by_suffix.get(path.suffix)
+            if analyzer is None:
+                analyzer = next((a for a in self.analyzers if a.can_handle(path)), None)
+            files.append((path, path.relative_to(repo_path), analyzer))
+
+        # Directory nodes by their path parts, shared by all files
+        dirs: dict[tuple[str, ...], CodeNode] = {(): root}
+
+        # Parsing is CPU-bound, so optionally spread it over processes for local repositories
+        analyzers = [analyzer for _, _, analyzer in files]
+        paths = [path for path, _, _ in files]
+        workers = min(self.max_workers or os.process_cpu_count() or 1, len(files))
+        results = None
+        if workers > 1 and not repo_path.protocol:
+            results = self._analyze_parallel(analyzers, paths, workers)
+        if results is None:
+            results = list(map(_analyze_file, analyzers, paths))
+
+        # Build directory structure
+        for (path, rel_path, _), result in zip(files, results):
+            if isinstance(result, Exception):
+                msg = f"Error analyzing {path}: {result}"
                 warnings.warn(msg, RuntimeWarning, stacklevel=1)
+                continue
+
+            # Ensure correct paths in nodes
+            rel_str = str(rel_path)
+            for node in result:
+                object.__setattr__(node, "path", rel_str)
+            self._add_to_tree(dirs, rel_path, result)
 
         return root
 
-    def _add_to_tree(self, root: CodeNode, rel_path: UPath, nodes: list[CodeNode]) -> None:
-        """Add analyzed nodes to the tree structure."""
-        current = root
-        for part in rel_path.parent.parts:
-            assert current.children is not None
-            if part not in current.children:
-                new_node = CodeNode(
-                    name=part,
-                    node_type=NodeType.DIRECTORY,
-                    path=str(UPath(current.path) / part),
-                    children={},
-                    parent=current,  # Set parent reference
-                )
-                current.children[part] = new_node  # type: ignore
-            current = current.children[part]
+    def _analyze_parallel(
+        self,
+        analyzers: list[CodeAnalyzer | None],
+        paths: list[UPath],
+        workers: int,
+    ) -> list[list[CodeNode] | Exception] | None:
+        """Analyze files in worker processes.
+
+        Errors in single files are returned per file, like in-process analysis.
+
+        Returns:
+            Results in the order of paths, or None if the pool itself failed,
+            e.g. because an analyzer could not be pickled or workers could not
+            start. The caller then analyzes in-process instead.
+        """
+        try:
+            with ProcessPoolExecutor(workers) as executor:
+                return list(executor.map(_analyze_file, analyzers, paths, chunksize=8))
+        except Exception as e:  # noqa: BLE001
+            msg = f"Parallel analysis failed, analyzing in-process instead: {e!r}"
+            warnings.warn(msg, RuntimeWarning, stacklevel=1)
+            return None
+
+    def _analyzers_by_suffix(self) -> dict[str, CodeAnalyzer]:
+        """Map file suffixes to the analyzer `can_handle` would pick first.
+
+        Only analyzers keeping the default, extension-based `can_handle` can be
+        resolved by suffix. Mapping stops at the first analyzer overriding it or
+        using multi-part extensions, since that one might claim any path ahead of
+        later analyzers. Suffixes missing from the map still go through `can_handle`.
+        """
+        by_suffix: dict[str, CodeAnalyzer] = {}
+        # Lowercased extensions already claimed in any case
+        claimed_any_case: set[str] = set()
+        for analyzer in self.analyzers:
+            if type(analyzer).can_handle is not CodeAnalyzer.can_handle or not all(
+                suffix and PurePosixPath(f"_{suffix}").suffix == suffix
+                for suffix in analyzer.extensions
+            ):
+                break
+            for suffix in analyzer.extensions:
+                if suffix not in by_suffix and suffix.lower() not in claimed_any_case:
+                    by_suffix[suffix] = analyzer
+            if analyzer.ignore_case:
+                claimed_any_case.update(analyzer.extensions)
+        return by_suffix
+
+    def _add_to_tree(
+        self,
+        dirs: dict[tuple[str, ...], CodeNode],
+        rel_path: UPath,
+        nodes: list[CodeNode],
+    ) -> None:
+        """Add analyzed nodes to the tree structure.
+
+        Args:
+            dirs: Directory nodes created so far, keyed by their path parts.
+                Must contain the root node under the empty tuple.
+            rel_path: Path of the analyzed file relative to the root
+            nodes: Nodes returned by the analyzer
+        """
+        parts = tuple(rel_path.parent.parts)
+        current = dirs.get(parts)
+        if current is None:
+            current = dirs[()]
+            for depth, part in enumerate(parts, 1):
+                key = parts[:depth]
+                if (node := dirs.get(key)) is None:
+                    node = CodeNode(
+                        name=part,
+                        node_type=NodeType.DIRECTORY,
+                        path="/".join(key),
+                        children={},
+                        parent=current,  # Set parent reference
+                    )
+                    current.children[part] = node  # type: ignore
+                    dirs[key] = node
+                current = node
 
         # Add file and its nodes
         if nodes:
@@ -351,16 +464,14 @@ class RepoMapper:
         focused_paths: set[str] | None = None,
     ) -> None:
         """Calculate importance scores for all nodes."""
-        # Collect all nodes
+        # Collect all nodes in pre-order using an explicit stack
         all_nodes: list[CodeNode] = []
-
-        def collect_nodes(node: CodeNode) -> None:
+        stack = [root]
+        while stack:
+            node = stack.pop()
             all_nodes.append(node)
             if node.children:
-                for child in node.children.values():
-                    collect_nodes(child)
-
-        collect_nodes(root)
+                stack.extend(reversed(list(node.children.values())))
 
         # Calculate scores
         scores = self.importance_calculator.calculate(
@@ -368,10 +479,11 @@ class RepoMapper:
             focused_paths=focused_paths,
         )
 
-        # Apply scores
+        # Apply scores. CodeNode is frozen, so write the fields directly
+        set_field = object.__setattr__
+        get_score = scores.get
         for node in all_nodes:
-            score = scores.get(node.path, 0.0)
-            object.__setattr__(node, "importance", score)
+            set_field(node, "importance", get_score(node.path, 0.0))
 
 
 if __name__ == "__main__":
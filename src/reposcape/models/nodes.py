@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
+import sys
 from typing import TYPE_CHECKING
 
 
@@ -24,7 +25,7 @@ class NodeType(Enum):
     ASYNC_METHOD = auto()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Reference:
     """Represents a reference to a symbol."""
 
@@ -36,7 +37,7 @@ class Reference:
     source: CodeNode | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CodeNode:
     """Immutable representation of a code element."""
 
@@ -53,12 +54,28 @@ class CodeNode:
     importance: float = 0.0
     is_private: bool = False
     parent: CodeNode | None = None
+    # Signature flattened to a single line, derived from signature
+    compact_signature: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        """Initialize empty collections if None."""
+        """Initialize empty collections if None and derive the compact signature."""
+        # Names like "__init__" or "utils.py" repeat across the tree, share one copy
+        object.__setattr__(self, "name", sys.intern(self.name))
         if self.children is None:
             object.__setattr__(self, "children", {})
         if self.references_to is None:
             object.__setattr__(self, "references_to", [])
         if self.referenced_by is None:
             object.__setattr__(self, "referenced_by", [])
+        if self.signature:
+            compact = self.signature.replace("\n", " ").replace("    ", "")
+            object.__setattr__(self, "compact_signature", compact)
+
+    def sorted_children(self) -> list[CodeNode]:
+        """Get children ordered by descending importance, then name."""
+        return sorted(self.children.values(), key=_importance_order)  # type: ignore
+
+
+def _importance_order(node: CodeNode) -> tuple[float, str]:
+    """Sort key putting important nodes first, ties broken by name."""
+    return -node.importance, node.name
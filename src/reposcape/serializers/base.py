@@ -1,16 +1,24 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from itertools import islice
 from typing import TYPE_CHECKING, NamedTuple
 
+from reposcape.models.nodes import NodeType
 from reposcape.models.options import DetailLevel
 
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
     from reposcape.models.nodes import CodeNode
     from reposcape.models.options import PrivacyMode
 
 
+# Name suffix for filesystem nodes, code elements have no entry
+_PATH_SUFFIXES: dict[NodeType, str] = {NodeType.DIRECTORY: "/", NodeType.FILE: ""}
+
+
 class NodePriority(NamedTuple):
     """Priority information for a node."""
 
@@ -59,22 +67,39 @@ class CodeSerializer(ABC):
 
         return count_tokens(text)
 
-    def _estimate_node_tokens(
-        self,
-        node: CodeNode,
-        detail: DetailLevel,
-    ) -> int:
-        """Estimate tokens needed for a node."""
-        tokens = self._estimate_tokens(node.name)
+    def _estimate_tokens_batch(self, texts: Sequence[str]) -> list[int]:
+        """Estimate tokens for many texts, in order.
+
+        Falls back to per-text _estimate_tokens if a subclass overrides it.
+        """
+        if type(self)._estimate_tokens is not CodeSerializer._estimate_tokens:
+            return [self._estimate_tokens(text) for text in texts]
+
+        from reposcape.utils.tokens import count_tokens_batch
+
+        return count_tokens_batch(texts)
+
+    def _node_texts(self, node: CodeNode, detail: DetailLevel) -> list[str]:
+        """Get the texts of a node that count towards its token cost."""
+        texts = [node.name]
 
         if detail != DetailLevel.STRUCTURE:
             if node.signature:
-                tokens += self._estimate_tokens(node.signature)
+                texts.append(node.signature)
             if detail == DetailLevel.DOCSTRINGS and node.docstring:
-                tokens += self._estimate_tokens(node.docstring)
+                texts.append(node.docstring)
             if detail == DetailLevel.FULL_CODE and node.content:
-                tokens += self._estimate_tokens(node.content)
+                texts.append(node.content)
 
+        return texts
+
+    def _estimate_node_tokens(
+        self,
+        node: CodeNode,
+        detail: DetailLevel,
+    ) -> int:
+        """Estimate tokens needed for a node."""
+        tokens = sum(self._estimate_tokens(text) for text in self._node_texts(node, detail))
         return tokens + 10  # Buffer for formatting
 
     def _should_include_node(
@@ -104,15 +129,47 @@ class CodeSerializer(ABC):
                     )
         return True
 
+    def _include_filter(
+        self,
+        included: set[str] | None,
+        privacy: PrivacyMode,
+    ) -> Callable[[CodeNode], bool] | None:
+        """Get a predicate for the nodes to include in output.
+
+        Gives the same result as `_should_include_node`, but with the common
+        cases reduced to a single check unless a subclass overrides it.
+        None means all nodes are included.
+        """
+        if type(self)._should_include_node is not CodeSerializer._should_include_node:
+            return lambda node: self._should_include_node(node, included, privacy)
+        if included is not None:
+            return lambda node: node.path in included
+        match privacy:
+            case "all":
+                return None
+            case "public_only":
+                return lambda node: not node.is_private
+        should_include = self._should_include_node
+        return lambda node: not node.is_private or should_include(node, None, privacy)
+
     def _calculate_priority(
         self,
         node: CodeNode,
         detail: DetailLevel,
         privacy: PrivacyMode,
+        tokens: int | None = None,
     ) -> NodePriority:
-        """Calculate priority score for a node."""
+        """Calculate priority score for a node.
+
+        Args:
+            node: Node to calculate the priority for
+            detail: Level of detail to include
+            privacy: Privacy mode for filtering private nodes
+            tokens: Tokens needed for the node, estimated if not given
+        """
         base_score = node.importance
-        tokens = self._estimate_node_tokens(node, detail)
+        if tokens is None:
+            tokens = self._estimate_node_tokens(node, detail)
 
         if not node.is_private:
             return NodePriority(node, tokens, base_score, base_score)
@@ -150,8 +207,22 @@ class CodeSerializer(ABC):
         priorities: list[NodePriority] = []
         required_paths: set[str] = set()
 
-        def process_node(node: CodeNode) -> None:
-            priority = self._calculate_priority(node, detail, privacy)
+        # Pre-order walk with an explicit stack
+        nodes: list[CodeNode] = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            if node.children:
+                stack.extend(reversed(list(node.children.values())))
+
+        # Count tokens for all nodes in one batch
+        node_texts = [self._node_texts(node, detail) for node in nodes]
+        counts = iter(self._estimate_tokens_batch([text for texts in node_texts for text in texts]))
+
+        for node, texts in zip(nodes, node_texts):
+            tokens = sum(islice(counts, len(texts))) + 10  # Buffer for formatting
+            priority = self._calculate_priority(node, detail, privacy, tokens)
             priorities.append(priority)
 
             # Mark parents of important nodes as required
@@ -161,12 +232,6 @@ class CodeSerializer(ABC):
                     required_paths.add(current.parent.path)
                     current = current.parent
 
-            if node.children:
-                for child in node.children.values():
-                    process_node(child)
-
-        process_node(root)
-
         # Boost required nodes
         return [
             NodePriority(
@@ -4,9 +4,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from reposcape.models.nodes import NodeType
 from reposcape.models.options import DetailLevel
-from reposcape.serializers.base import CodeSerializer
+from reposcape.serializers.base import _PATH_SUFFIXES, CodeSerializer
+from reposcape.serializers.flat import FlatTree
 
 
 if TYPE_CHECKING:
@@ -60,40 +60,20 @@ class CompactSerializer(CodeSerializer):
         privacy: PrivacyMode = "smart",
         included: set[str] | None = None,
     ) -> None:
-        """Serialize node in compact format."""
-        if not self._should_include_node(node, included, privacy):
-            return
+        """Serialize node and its descendants in compact format."""
+        flat = FlatTree(node, self._include_filter(included, privacy))
+        append = lines.append
+        show_signature = detail != DetailLevel.STRUCTURE
+        for current, depth in zip(flat.nodes, flat.depths):
+            # Format node line
+            indent = prefix + "  " * depth
+            privacy_indicator = "🔒" if current.is_private else ""
 
-        # Format node line
-        privacy_indicator = "🔒" if node.is_private else ""
-
-        match node.node_type:
-            case NodeType.DIRECTORY:
-                line = f"{prefix}{node.name}/"
-            case NodeType.FILE:
-                line = f"{prefix}{node.name}"
-            case _:
-                # For code elements, show signature in compact form
-                if detail != DetailLevel.STRUCTURE and node.signature:
-                    sig = node.signature.replace("\n", " ").replace("    ", "")
-                    line = f"{prefix}{privacy_indicator}{sig}"
-                else:
-                    line = f"{prefix}{privacy_indicator}{node.name}"
-
-        lines.append(line)
-
-        # Process children
-        if node.children:
-            new_prefix = prefix + "  "
-            for child in sorted(
-                node.children.values(),
-                key=lambda n: (-n.importance, n.name),
-            ):
-                self._serialize_node_with_children(
-                    child,
-                    lines,
-                    prefix=new_prefix,
-                    detail=detail,
-                    privacy=privacy,
-                    included=included,
-                )
+            suffix = _PATH_SUFFIXES.get(current.node_type)
+            if suffix is not None:
+                append(f"{indent}{current.name}{suffix}")
+            # For code elements, show signature in compact form
+            elif show_signature and current.signature:
+                append(f"{indent}{privacy_indicator}{current.compact_signature}")
+            else:
+                append(f"{indent}{privacy_indicator}{current.name}")
@@ -0,0 +1,73 @@
+"""Flat pre-order layout of a node tree for serialization."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from reposcape.models.nodes import CodeNode
+
+
+class FlatTree:
+    """Node tree flattened into parallel lists in serialization order.
+
+    Nodes are laid out in pre-order with children sorted by importance, so
+    serializers can walk positions front to back instead of chasing children.
+    All lists are indexed by position:
+
+    - nodes: The node at each position
+    - depths: Depth below the root, which has depth 0
+    - last: Whether the node is the last of its siblings, excluded ones included
+    """
+
+    __slots__ = ("depths", "last", "nodes")
+
+    def __init__(
+        self,
+        root: CodeNode,
+        include: Callable[[CodeNode], bool] | None = None,
+    ):
+        """Flatten the tree below root.
+
+        Args:
+            root: Root node of the tree
+            include: Predicate for nodes to keep. Rejected nodes are left out
+                together with their subtree. None keeps all nodes.
+        """
+        self.nodes: list[CodeNode] = []
+        self.depths: list[int] = []
+        self.last: list[bool] = []
+        if include is not None and not include(root):
+            return
+
+        nodes = self.nodes
+        depths = self.depths
+        last = self.last
+        stack = [(root, 0, True)]
+        while stack:
+            node, depth, is_last = stack.pop()
+            nodes.append(node)
+            depths.append(depth)
+            last.append(is_last)
+
+            if node.children:
+                # Push in reverse so children are popped in sorted order
+                *children, last_child = node.sorted_children()
+                child_depth = depth + 1
+                if include is None:
+                    stack.append((last_child, child_depth, True))
+                    stack.extend((child, child_depth, False) for child in reversed(children))
+                else:
+                    if include(last_child):
+                        stack.append((last_child, child_depth, True))
+                    stack.extend(
+                        (child, child_depth, False)
+                        for child in reversed(children)
+                        if include(child)
+                    )
+
+    def __len__(self) -> int:
+        return len(self.nodes)
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 from reposcape.models.nodes import NodeType
 from reposcape.models.options import DetailLevel
 from reposcape.serializers.base import CodeSerializer
+from reposcape.serializers.flat import FlatTree
 
 
 if TYPE_CHECKING:
@@ -14,6 +15,21 @@ if TYPE_CHECKING:
     from reposcape.models.options import PrivacyMode
 
 
+_FENCE_OPEN = "```python"
+_FENCE_CLOSE = "```"
+
+# Header icon, name suffix and whether to mark private nodes, by node type.
+# Types without an entry get no header.
+_HEADERS: dict[NodeType, tuple[str, str, bool]] = {
+    NodeType.DIRECTORY: ("📁 ", "/", False),
+    NodeType.FILE: ("📄 ", "", False),
+    NodeType.CLASS: ("🔷 ", "", True),
+    NodeType.FUNCTION: ("🔸 ", "", True),
+    NodeType.METHOD: ("🔸 ", "", True),
+    NodeType.VARIABLE: ("📎 ", "", True),
+}
+
+
 class MarkdownSerializer(CodeSerializer):
     """Serialize code structure to Markdown format."""
 
@@ -61,47 +77,28 @@ class MarkdownSerializer(CodeSerializer):
         included: set[str] | None = None,
     ) -> None:
         """Serialize a node and its children."""
-        if not self._should_include_node(node, included, privacy):
-            return
-
-        # Add node header
-        prefix = "#" * (depth + 1) + " "
-        privacy_indicator = "🔒 " if node.is_private else ""
-
-        match node.node_type:
-            case NodeType.DIRECTORY:
-                lines.append(f"{prefix}📁 {node.name}/")
-            case NodeType.FILE:
-                lines.append(f"{prefix}📄 {node.name}")
-            case NodeType.CLASS:
-                lines.append(f"{prefix}🔷 {privacy_indicator}{node.name}")
-            case NodeType.FUNCTION | NodeType.METHOD:
-                lines.append(f"{prefix}🔸 {privacy_indicator}{node.name}")
-            case NodeType.VARIABLE:
-                lines.append(f"{prefix}📎 {privacy_indicator}{node.name}")
-
-        # Add details based on detail level
-        if detail != DetailLevel.STRUCTURE:
-            if node.signature:
-                lines.append(f"```python\n{node.signature}\n```")
-
-            if detail == DetailLevel.DOCSTRINGS and node.docstring:
-                lines.append(f"```python\n{node.docstring}\n```")
-
-            if detail == DetailLevel.FULL_CODE and node.content:
-                lines.append(f"```python\n{node.content}\n```")
-
-        # Process children
-        if node.children:
-            for child in sorted(
-                node.children.values(),
-                key=lambda n: (-n.importance, n.name),
-            ):
-                self._serialize_node_with_children(
-                    child,
-                    lines,
-                    depth=depth + 1,
-                    detail=detail,
-                    privacy=privacy,
-                    included=included,
-                )
+        flat = FlatTree(node, self._include_filter(included, privacy))
+        append = lines.append
+        extend = lines.extend
+        show_signature = detail != DetailLevel.STRUCTURE
+        show_docstring = detail == DetailLevel.DOCSTRINGS
+        show_content = detail == DetailLevel.FULL_CODE
+        for current, node_depth in zip(flat.nodes, flat.depths):
+            # Add node header
+            if header := _HEADERS.get(current.node_type):
+                icon, suffix, mark_private = header
+                prefix = "#" * (depth + node_depth + 1) + " "
+                privacy_indicator = "🔒 " if mark_private and current.is_private else ""
+                append(f"{prefix}{icon}{privacy_indicator}{current.name}{suffix}")
+
+            # Add details based on detail level. Fences and text are separate lines
+            # so the text is only copied once, by the final join.
+            if show_signature:
+                if current.signature:
+                    extend((_FENCE_OPEN, current.signature, _FENCE_CLOSE))
+
+                if show_docstring and current.docstring:
+                    extend((_FENCE_OPEN, current.docstring, _FENCE_CLOSE))
+
+                if show_content and current.content:
+                    extend((_FENCE_OPEN, current.content, _FENCE_CLOSE))
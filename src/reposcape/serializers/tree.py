@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
-from reposcape.models.nodes import NodeType
 from reposcape.models.options import DetailLevel
-from reposcape.serializers.base import CodeSerializer
+from reposcape.serializers.base import _PATH_SUFFIXES, CodeSerializer
+from reposcape.serializers.flat import FlatTree
 
 
 if TYPE_CHECKING:
@@ -14,6 +15,21 @@ if TYPE_CHECKING:
     from reposcape.models.options import PrivacyMode
 
 
+@lru_cache(maxsize=4096)
+def _tree_prefix(last_bits: int, depth: int) -> str:
+    """Get the line prefix for a node below the root.
+
+    Cached so that the few distinct prefixes of a tree are built once and shared.
+
+    Args:
+        last_bits: Bit i set if the node's ancestor at depth i + 1 is a last child,
+            bit depth - 1 is the node itself
+        depth: Depth of the node, at least 1
+    """
+    indent = "".join("    " if last_bits >> i & 1 else "│   " for i in range(depth - 1))
+    return indent + ("└── " if last_bits >> (depth - 1) & 1 else "├── ")
+
+
 class TreeSerializer(CodeSerializer):
     """Serialize code structure in a tree-like format."""
 
@@ -28,7 +44,6 @@ class TreeSerializer(CodeSerializer):
         self._serialize_node_with_children(
             node,
             lines,
-            is_last=[True],
             detail=detail,
             privacy=privacy,
         )
@@ -44,7 +59,6 @@ class TreeSerializer(CodeSerializer):
         self._serialize_node_with_children(
             root,
             lines,
-            is_last=[True],
             detail=detail,
             included=included,
         )
@@ -55,52 +69,32 @@ class TreeSerializer(CodeSerializer):
         node: CodeNode,
         lines: list[str],
         *,
-        is_last: list[bool],
         detail: DetailLevel,
         privacy: PrivacyMode = "smart",
         included: set[str] | None = None,
     ) -> None:
-        """Serialize node in tree format."""
-        if not self._should_include_node(node, included, privacy):
-            return
-
-        # Create the prefix with tree structure
-        if len(is_last) == 1:
-            prefix = ""
-        else:
-            prefix = "".join("    " if last else "│   " for last in is_last[1:-1])
-            prefix += "└── " if is_last[-1] else "├── "
-
-        # Format node with privacy indicator
-        privacy_indicator = "🔒" if node.is_private else ""
-
-        match node.node_type:
-            case NodeType.DIRECTORY:
-                line = f"{prefix}{node.name}/"
-            case NodeType.FILE:
-                line = f"{prefix}{node.name}"
-            case _:
-                if detail != DetailLevel.STRUCTURE and node.signature:
-                    sig = node.signature.replace("\n", " ").replace("    ", "")
-                    line = f"{prefix}{privacy_indicator}{sig}"
-                else:
-                    line = f"{prefix}{privacy_indicator}{node.name}"
-
-        lines.append(line)
-
-        # Process children
-        if node.children:
-            children = sorted(
-                node.children.values(),
-                key=lambda n: (-n.importance, n.name),
-            )
-            for i, child in enumerate(children):
-                is_last_child = i == len(children) - 1
-                self._serialize_node_with_children(
-                    child,
-                    lines,
-                    is_last=[*is_last, is_last_child],
-                    detail=detail,
-                    privacy=privacy,
-                    included=included,
-                )
+        """Serialize node and its descendants in tree format."""
+        flat = FlatTree(node, self._include_filter(included, privacy))
+        # Last-child flags of the current node and its ancestors, one bit per depth
+        last_bits = 0
+        prefix = ""
+        append = lines.append
+        show_signature = detail != DetailLevel.STRUCTURE
+        for current, depth, is_last in zip(flat.nodes, flat.depths, flat.last):
+            if depth:
+                # Keep the ancestors' bits and set the one for this depth
+                last_bits &= (1 << (depth - 1)) - 1
+                if is_last:
+                    last_bits |= 1 << (depth - 1)
+                prefix = _tree_prefix(last_bits, depth)
+
+            # Format node with privacy indicator
+            privacy_indicator = "🔒" if current.is_private else ""
+
+            suffix = _PATH_SUFFIXES.get(current.node_type)
+            if suffix is not None:
+                append(f"{prefix}{current.name}{suffix}")
+            elif show_signature and current.signature:
+                append(f"{prefix}{privacy_indicator}{current.compact_signature}")
+            else:
+                append(f"{prefix}{privacy_indicator}{current.name}")
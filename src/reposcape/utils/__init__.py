@@ -2,6 +2,6 @@
 
 from __future__ import annotations
 
-from .tokens import count_tokens, get_tokenizer
+from .tokens import count_tokens, count_tokens_batch, get_tokenizer
 
-__all__ = ["count_tokens", "get_tokenizer"]
+__all__ = ["count_tokens", "count_tokens_batch", "get_tokenizer"]
@@ -3,16 +3,49 @@
 from __future__ import annotations
 
 from functools import lru_cache
+from typing import TYPE_CHECKING
 
 import tiktoken
 
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
 @lru_cache(maxsize=1)
 def get_tokenizer(model: str = "gpt-3.5-turbo") -> tiktoken.Encoding:
     """Get cached tokenizer for model."""
     return tiktoken.encoding_for_model(model)
 
 
+# Longest text whose count is memoized, keeps file contents out of the cache
+_MAX_CACHED_LENGTH = 256
+
+
 def count_tokens(text: str, model: str = "gpt-3.5-turbo") -> int:
-    """Count tokens in text using the model's tokenizer."""
+    """Count tokens in text using the model's tokenizer.
+
+    Counts of short texts are cached, since names and signatures repeat across
+    nodes and serializations.
+    """
+    if len(text) <= _MAX_CACHED_LENGTH:
+        return _count_short_tokens(text, model)
+    return len(get_tokenizer(model).encode(text))
+
+
+@lru_cache(maxsize=4096)
+def _count_short_tokens(text: str, model: str) -> int:
+    """Count tokens in a short text, memoized."""
     return len(get_tokenizer(model).encode(text))
+
+
+def count_tokens_batch(texts: Sequence[str], model: str = "gpt-3.5-turbo") -> list[int]:
+    """Count tokens for many texts.
+
+    Each distinct text is counted once through count_tokens.
+
+    Returns:
+        Token counts in the same order as texts
+    """
+    counts = {text: count_tokens(text, model) for text in dict.fromkeys(texts)}
+    return [counts[text] for text in texts]
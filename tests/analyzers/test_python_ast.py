@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 
 from reposcape.analyzers import PythonAstAnalyzer
 from reposcape.models import NodeType
 
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
 def test_analyzer_can_handle_python_files():
     """Test file type detection."""
     analyzer = PythonAstAnalyzer()
@@ -144,3 +150,26 @@ def test_invalid_python_handling(invalid_content: str):
     analyzer = PythonAstAnalyzer()
     with pytest.raises(SyntaxError):
         analyzer.analyze_file("test.py", content=invalid_content)
+
+
+def test_analyze_file_normalizes_newlines(tmp_path: Path):
+    """Test that file content matches text-mode reading for CRLF and BOM files."""
+    path = tmp_path / "crlf.py"
+    path.write_bytes(b"\xef\xbb\xbfdef func():\r\n    return 1\r\n")
+
+    root = PythonAstAnalyzer().analyze_file(path)[0]
+
+    assert root.content == "def func():\n    return 1\n"
+    assert "func" in root.children
+
+
+@pytest.mark.parametrize("cookie", [b"# -*- coding: uft-8 -*-", b"# coding: latin-1"])
+def test_analyze_file_ignores_coding_cookie(tmp_path: Path, cookie: bytes):
+    """Test that files are read as UTF-8 whatever their coding cookie says."""
+    path = tmp_path / "cookie.py"
+    path.write_bytes(cookie + b'\ndef func():\n    """Gr\xc3\xbc\xc3\x9fe"""\n')
+
+    root = PythonAstAnalyzer().analyze_file(path)[0]
+
+    assert root.children["func"].docstring == "Grüße"
+    assert "Grüße" in root.content
@@ -127,3 +127,26 @@ def test_remove_nonexistent_node():
 
     # Original node should still be there
     assert "a" in graph.get_nodes()
+
+
+def test_has_node():
+    """Test node membership lookup."""
+    graph = Graph()
+
+    graph.add_edge("a", "b")
+
+    assert graph.has_node("a")
+    assert graph.has_node("b")
+    assert not graph.has_node("c")
+
+
+def test_edge_view_is_live():
+    """Test that edge views follow later graph changes."""
+    graph = Graph()
+
+    graph.add_edge("a", "b", weight=0.5)
+    edges = graph.get_edges("a")
+    graph.add_edge("a", "c")
+
+    assert edges == {"b": 0.5, "c": 1.0}
+    assert len(edges) == 2  # noqa: PLR2004
@@ -106,3 +106,11 @@ def test_invalid_graph_handling():
 
     # Only existing nodes should be scored
     assert set(scores.keys()) == {"a", "b"}
+
+
+def test_distance_scores_decay(simple_graph: Graph):
+    """Test that distance scores decay with distance from important nodes."""
+    scorer = ReferenceScorer(distance_decay=0.5)
+    scores = scorer._calculate_distance_scores(simple_graph, {"a", "nonexistent"})
+
+    assert scores == {"a": 1.0, "b": 0.5, "c": 0.25}
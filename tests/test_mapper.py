@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+from pathlib import Path, PurePosixPath
+import subprocess
+import sys
+from typing import TYPE_CHECKING
 
 import pytest
+from upath import UPath
 
-from reposcape.mapper import RepoMapper
+from reposcape.analyzers import PythonAstAnalyzer, TextAnalyzer
+from reposcape.mapper import RepoMapper, _compile_exclude_patterns
 from reposcape.models import DetailLevel
 
 
+if TYPE_CHECKING:
+    from reposcape.analyzers import CodeAnalyzer
+
+
 # Test repository content
 MAIN_PY = """\"\"\"Main module.\"\"\"
 from .utils import helper
@@ -202,3 +211,186 @@ def test_error_handling(temp_repo: Path):
     # Should skip invalid file but include valid ones
     assert "invalid.py" not in result
     assert "main.py" in result
+
+
+def test_parallel_analysis_matches_serial(temp_repo: Path):
+    """Test that analyzing files in worker processes gives the same result."""
+    serial = RepoMapper(max_workers=1).create_overview(temp_repo)
+    parallel = RepoMapper(max_workers=2).create_overview(temp_repo)
+
+    assert parallel == serial
+
+
+# Unguarded module-level usage, as in the README
+SPAWN_SCRIPT = """
+import multiprocessing
+import sys
+
+from upath import UPath
+
+from reposcape.mapper import RepoMapper
+
+
+def outline(node):
+    return [(node.path, node.signature, [outline(c) for c in node.children.values()])]
+
+
+if __name__ == "__main__":
+    multiprocessing.set_start_method("spawn", force=True)
+    repo = UPath(sys.argv[1])
+    serial = RepoMapper()._analyze_repository(repo)
+    parallel = RepoMapper(max_workers=2)._analyze_repository(repo)
+    print(outline(parallel) == outline(serial), "setup.py" in parallel.children)
+"""
+
+
+def test_parallel_analysis_under_spawn(temp_repo: Path, tmp_path: Path):
+    """Test that the process pool works with the spawn start method."""
+    script = tmp_path / "script.py"
+    script.write_text(SPAWN_SCRIPT)
+
+    result = subprocess.run(
+        [sys.executable, str(script), str(temp_repo)],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "Parallel analysis failed" not in result.stderr
+    assert result.stdout.split() == ["True", "True"]
+
+
+def test_parallel_analysis_falls_back_to_serial(temp_repo: Path):
+    """Test that a failing process pool falls back to in-process analysis."""
+
+    class UnpicklableAnalyzer(PythonAstAnalyzer):
+        def __init__(self) -> None:
+            self.callback = lambda: None
+
+    analyzers = [UnpicklableAnalyzer(), TextAnalyzer()]
+    serial = RepoMapper(analyzers=analyzers).create_overview(temp_repo)
+    mapper = RepoMapper(analyzers=analyzers, max_workers=2)
+    with pytest.warns(RuntimeWarning, match="Parallel analysis failed"):
+        parallel = mapper.create_overview(temp_repo)
+
+    assert parallel == serial
+
+
+def recording(analyzer_cls: type[CodeAnalyzer]) -> type[CodeAnalyzer]:
+    """Subclass an analyzer to record the names of the files it analyzes."""
+
+    class Recording(analyzer_cls):  # type: ignore[valid-type,misc]
+        def __init__(self) -> None:
+            super().__init__()
+            self.seen: list[str] = []
+
+        def analyze_file(self, path, content=None):
+            self.seen.append(UPath(path).name)
+            return super().analyze_file(path, content)
+
+    return Recording
+
+
+@pytest.fixture
+def mixed_repo(tmp_path: Path) -> Path:
+    """Create a repository with files of different suffixes."""
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    for path in ("a.py", "b.md", "c.MD", "d.txt", "e.rst", "f.cfg", "docs/g.py"):
+        (tmp_path / path).write_text("x = 1\n", encoding="utf-8")
+    return tmp_path
+
+
+def test_analyzer_selection_by_suffix(mixed_repo: Path):
+    """Test that each file goes to the first analyzer that can handle it."""
+    python, text = recording(PythonAstAnalyzer)(), recording(TextAnalyzer)()
+    RepoMapper(analyzers=[python, text]).create_overview(mixed_repo)
+
+    assert sorted(python.seen) == ["a.py", "g.py"]
+    assert sorted(text.seen) == ["b.md", "c.MD", "d.txt", "e.rst"]
+
+
+def test_analyzer_selection_follows_order(mixed_repo: Path):
+    """Test that earlier analyzers win, also for other cases of an extension."""
+
+    class UpperAnalyzer(TextAnalyzer):
+        extensions = (".MD", ".py")
+
+    text, upper = recording(TextAnalyzer)(), recording(UpperAnalyzer)()
+    RepoMapper(analyzers=[text, upper]).create_overview(mixed_repo)
+
+    assert sorted(text.seen) == ["b.md", "c.MD", "d.txt", "e.rst"]
+    assert sorted(upper.seen) == ["a.py", "g.py"]
+
+
+def test_analyzer_can_handle_override(mixed_repo: Path):
+    """Test that an analyzer overriding can_handle is asked before later ones."""
+
+    class DocsAnalyzer(TextAnalyzer):
+        def can_handle(self, path):
+            return "/docs/" in str(path)
+
+    docs, python = recording(DocsAnalyzer)(), recording(PythonAstAnalyzer)()
+    RepoMapper(analyzers=[docs, python]).create_overview(mixed_repo)
+
+    assert docs.seen == ["g.py"]
+    assert python.seen == ["a.py"]
+
+
+def test_analyzer_subclass_can_handle_is_respected(temp_repo: Path):
+    """Test that a subclass narrowing can_handle is not bypassed."""
+
+    class NoTests(PythonAstAnalyzer):
+        def can_handle(self, path):
+            return super().can_handle(path) and "/tests/" not in str(path)
+
+    mapper = RepoMapper(analyzers=[NoTests()])
+    result = mapper.create_overview(temp_repo, detail=DetailLevel.SIGNATURES)
+
+    assert "test_main.py" in result
+    assert "def test_main()" not in result
+    assert "def main()" in result
+
+
+@pytest.mark.parametrize(
+    ("pattern", "path", "expected"),
+    [
+        # Relative patterns match from the right
+        ("*.py", "a/b.py", True),
+        ("*.py", "a/b.pyc", False),
+        ("tests/*", "x/tests/a.py", True),
+        ("tests/*", "tests/a/b.py", False),
+        ("b/*.py", "ab/c.py", False),
+        # Absolute patterns match the whole path
+        ("/a/*.py", "/a/b.py", True),
+        ("/a/*.py", "/x/a/b.py", False),
+        ("/a/*.py", "/a/b/c.py", False),
+        # "**" acts like "*"
+        ("**/*.py", "a/b.py", True),
+        ("a/**", "a/b/c", False),
+        ("a/**/c.py", "a/b/c.py", True),
+        ("a/**/c.py", "a/b/d/c.py", False),
+        # Hidden files are matched by wildcards
+        ("*.py", ".hidden.py", True),
+        (".*", "a/.git", True),
+        ("*", "a/.env", True),
+    ],
+)
+def test_compile_exclude_patterns(pattern: str, path: str, expected: bool):
+    """Test that compiled patterns follow PurePath.match."""
+    regex = _compile_exclude_patterns([pattern])
+    assert regex is not None
+    assert bool(regex.search(path)) is expected
+    assert PurePosixPath(path).match(pattern) is expected
+
+
+def test_compile_exclude_patterns_combined():
+    """Test that several patterns match if any of them does, and none gives None."""
+    assert _compile_exclude_patterns([]) is None
+    regex = _compile_exclude_patterns(["*.txt", "/build/*"])
+    assert regex is not None
+    assert regex.search("docs/readme.txt")
+    assert regex.search("/build/out")
+    assert not regex.search("src/build/out")
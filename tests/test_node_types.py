@@ -44,3 +44,34 @@ def test_node_immutability():
 
     with pytest.raises(dataclasses.FrozenInstanceError):
         node.name = "changed"  # type: ignore
+
+
+def test_sorted_children():
+    """Test children ordering by importance and name."""
+    children = {
+        "b": CodeNode(name="b", node_type=NodeType.FUNCTION, path="m.py", importance=0.5),
+        "a": CodeNode(name="a", node_type=NodeType.FUNCTION, path="m.py", importance=0.5),
+        "c": CodeNode(name="c", node_type=NodeType.FUNCTION, path="m.py", importance=0.9),
+    }
+    node = CodeNode(name="m.py", node_type=NodeType.FILE, path="m.py", children=children)
+
+    assert [child.name for child in node.sorted_children()] == ["c", "a", "b"]
+
+
+def test_node_replace_round_trip():
+    """Test rebuilding a node with new children, as the class visitors do."""
+    method = CodeNode(name="m", node_type=NodeType.METHOD, path="m.py")
+    node = CodeNode(
+        name="A",
+        node_type=NodeType.CLASS,
+        path="m.py",
+        signature="class A(\n    Base)",
+        docstring="Doc.",
+    )
+
+    rebuilt = dataclasses.replace(node, children={"m": method})
+
+    assert rebuilt.docstring == "Doc."
+    assert rebuilt.compact_signature == "class A( Base)"
+    assert rebuilt.sorted_children() == [method]
+    assert dataclasses.asdict(rebuilt)["name"] == "A"
@@ -0,0 +1,75 @@
+"""Tests for selecting nodes within a token budget."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from reposcape.models import CodeNode, NodeType
+from reposcape.serializers import CompactSerializer
+from reposcape.serializers.base import NodePriority
+
+
+def greedy_select(priorities: list[NodePriority], token_limit: int) -> set[str]:
+    """Reference selection: scan by score and take every node that still fits."""
+    included: set[str] = set()
+    tokens_used = 0
+    for priority in sorted(priorities, key=lambda p: p.adjusted_score, reverse=True):
+        if tokens_used + priority.tokens_needed <= token_limit and priority.adjusted_score > 0:
+            included.add(priority.node.path)
+            tokens_used += priority.tokens_needed
+    return included
+
+
+def make_priorities(specs: list[tuple[int, float]]) -> list[NodePriority]:
+    """Create priorities from (tokens, score) pairs, with paths by position."""
+    return [
+        NodePriority(
+            CodeNode(name=str(i), node_type=NodeType.FILE, path=str(i)),
+            tokens,
+            score,
+            score,
+        )
+        for i, (tokens, score) in enumerate(specs)
+    ]
+
+
+@pytest.mark.parametrize(
+    ("specs", "token_limit", "expected"),
+    [
+        # Ties keep their input order
+        ([(30, 0.5), (30, 0.5), (30, 0.5)], 60, {"0", "1"}),
+        # Zero and negative scores are never selected
+        ([(10, 0.0), (10, -0.2), (10, 0.1)], 100, {"2"}),
+        ([(10, 0.0), (10, -0.5)], 100, set()),
+        # A node too large for the rest of the budget is skipped, smaller ones still fit
+        ([(40, 0.9), (80, 0.8), (20, 0.7), (50, 0.6), (30, 0.5)], 100, {"0", "2", "4"}),
+        ([(40, 0.9), (80, 0.8), (30, 0.7), (10, 0.6), (20, 0.5)], 100, {"0", "2", "3", "4"}),
+        # Nothing fits
+        ([(200, 0.9), (150, 0.8)], 100, set()),
+        ([], 100, set()),
+    ],
+)
+def test_select_nodes_cases(specs: list[tuple[int, float]], token_limit: int, expected: set[str]):
+    """Test selection on hand-picked cases against the greedy scan."""
+    priorities = make_priorities(specs)
+    selected = CompactSerializer()._select_nodes(priorities, token_limit)
+    assert selected == expected
+    assert selected == greedy_select(priorities, token_limit)
+
+
+def test_select_nodes_matches_greedy_scan():
+    """Test selection on random priorities against the greedy scan."""
+    rng = random.Random(0)
+    serializer = CompactSerializer()
+    for _ in range(2000):
+        specs = [
+            (rng.randint(1, 60), rng.choice([0.0, -0.1, 0.5, rng.random()]))
+            for _ in range(rng.randint(0, 30))
+        ]
+        priorities = make_priorities(specs)
+        token_limit = rng.randint(1, 600)
+        assert serializer._select_nodes(priorities, token_limit) == greedy_select(
+            priorities, token_limit
+        )
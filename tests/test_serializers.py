@@ -0,0 +1,44 @@
+"""Tests for the code structure serializers."""
+
+from __future__ import annotations
+
+from reposcape.models import CodeNode, DetailLevel, NodeType
+from reposcape.serializers import CompactSerializer
+
+
+def make_package() -> CodeNode:
+    """Create a directory with two files."""
+    children = {
+        name: CodeNode(name=name, node_type=NodeType.FILE, path=f"pkg/{name}")
+        for name in ("a.py", "b.py")
+    }
+    return CodeNode(name="pkg", node_type=NodeType.DIRECTORY, path="pkg", children=children)
+
+
+def test_serialize_after_tree_changes():
+    """Test that changed children and importance show up in the next serialization."""
+    root = make_package()
+    serializer = CompactSerializer()
+    assert serializer.serialize(root, detail=DetailLevel.STRUCTURE) == "pkg/\n  a.py\n  b.py"
+
+    root.children["c.py"] = CodeNode(name="c.py", node_type=NodeType.FILE, path="pkg/c.py")  # type: ignore
+    object.__setattr__(root.children["b.py"], "importance", 0.5)
+    result = serializer.serialize(root, detail=DetailLevel.STRUCTURE)
+
+    assert result == "pkg/\n  b.py\n  a.py\n  c.py"
+
+
+def test_should_include_node_override():
+    """Test that a serializer overriding _should_include_node is respected."""
+
+    class SkipB(CompactSerializer):
+        def _should_include_node(self, node, included, privacy):
+            return node.name != "b.py"
+
+    root = make_package()
+    object.__setattr__(root.children["b.py"], "importance", 0.5)
+    for privacy in ("all", "public_only", "smart"):
+        result = SkipB().serialize(root, detail=DetailLevel.STRUCTURE, privacy=privacy)
+        assert result == "pkg/\n  a.py"
+    result = SkipB().serialize(root, detail=DetailLevel.STRUCTURE, token_limit=1000)
+    assert result == "pkg/\n  a.py"
@@ -0,0 +1,75 @@
+"""Tests for token counting."""
+
+from __future__ import annotations
+
+import pytest
+
+from reposcape.models import CodeNode, DetailLevel, NodeType
+from reposcape.serializers import CompactSerializer
+from reposcape.utils import tokens
+
+
+class RecordingEncoding:
+    """Encoding with one token per word that records the encoded texts."""
+
+    def __init__(self) -> None:
+        self.encoded: list[str] = []
+
+    def encode(self, text: str) -> list[int]:
+        self.encoded.append(text)
+        return list(range(len(text.split())))
+
+
+@pytest.fixture
+def encoding(monkeypatch: pytest.MonkeyPatch) -> RecordingEncoding:
+    """Replace the tokenizer with a recording one."""
+    encoding = RecordingEncoding()
+    monkeypatch.setattr(tokens, "get_tokenizer", lambda model="": encoding)
+    return encoding
+
+
+def test_count_tokens_batch_order_and_dedupe(encoding: RecordingEncoding):
+    """Test that counts follow input order and duplicates are encoded once."""
+    long_text = "lorem " * 1000
+    texts = ["batch one two", long_text, "batch", long_text, "", "batch one two"]
+    counts = tokens.count_tokens_batch(texts)
+
+    assert counts == [len(text.split()) for text in texts]
+    assert sorted(encoding.encoded) == sorted(set(texts))
+
+
+def test_count_tokens_batch_empty(encoding: RecordingEncoding):
+    """Test that no texts means no encoding."""
+    assert tokens.count_tokens_batch([]) == []
+    assert not encoding.encoded
+
+
+def test_serializer_uses_estimate_tokens_override(encoding: RecordingEncoding):
+    """Test that priorities honor a serializer overriding _estimate_tokens."""
+
+    class FixedSerializer(CompactSerializer):
+        def _estimate_tokens(self, text: str) -> int:
+            return 100
+
+    root = CodeNode(
+        name="main.py",
+        node_type=NodeType.FILE,
+        path="main.py",
+        docstring="Main module.",
+    )
+    priorities = FixedSerializer()._collect_priorities(root, DetailLevel.DOCSTRINGS, "smart")
+    texts = FixedSerializer()._node_texts(root, DetailLevel.DOCSTRINGS)
+
+    assert priorities[0].tokens_needed == 100 * len(texts) + 10
+    assert not encoding.encoded
+
+
+def test_count_tokens_memoizes_short_texts(encoding: RecordingEncoding):
+    """Test that short texts are encoded once and long texts like file contents each time."""
+    short_text = "def memoized_signature()"
+    long_text = "word " * 1000
+    for _ in range(2):
+        assert tokens.count_tokens(short_text) == len(short_text.split())
+        assert tokens.count_tokens(long_text) == len(long_text.split())
+
+    assert encoding.encoded == [short_text, long_text, long_text]